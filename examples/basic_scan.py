@@ -3,15 +3,21 @@
 Example usage of NSAF for basic network scanning and vulnerability assessment
 """
 
+import sys
+from collections import Counter
+
 from nsaf import NetworkScanner, VulnerabilityScanner, ReportGenerator, get_logger
+from nsaf.core.scanner import scan_results_to_soa
+from nsaf.utils import ScanCache
 
 def main():
     """Example NSAF usage"""
     logger = get_logger(__name__)
     
-    # Initialize components
-    scanner = NetworkScanner(timeout=3, max_threads=50)
-    vuln_scanner = VulnerabilityScanner()
+    # Initialize components; pass --no-cache to force a fresh scan
+    cache = None if "--no-cache" in sys.argv else ScanCache()
+    scanner = NetworkScanner(timeout=3, max_threads=50, cache=cache)
+    vuln_scanner = VulnerabilityScanner(cache=cache)
     report_generator = ReportGenerator()
     
     # Define target network
@@ -45,10 +51,17 @@ def main():
     print(f"{'Host':<15} {'Port':<8} {'State':<10} {'Service':<15} {'Version'}")
     print("-" * 70)
     
-    for host, results in scan_results.items():
-        for result in results:
-            print(f"{result.host:<15} {result.port:<8} {result.state:<10} "
-                  f"{result.service or 'unknown':<15} {result.version or ''}")
+    # Format all rows from the column layout, then emit them in one write
+    # instead of one flushing print per row
+    rows = [
+        f"{host:<15} {port:<8} {state:<10} {service or 'unknown':<15} {version or ''}"
+        for host, columns in scan_results_to_soa(scan_results).items()
+        for port, state, service, version in zip(
+            columns['port'], columns['state'],
+            columns['service'], columns['version'])
+    ]
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
     
     # 3. Vulnerability Assessment
     print("\n3. Assessing vulnerabilities...")
@@ -63,10 +76,8 @@ def main():
     # Display vulnerability summary
     if vulnerabilities:
         print("\n🚨 Vulnerability Summary:")
-        severity_counts = {}
-        for vuln in vulnerabilities:
-            severity_counts[vuln.severity] = severity_counts.get(vuln.severity, 0) + 1
-        
+        severity_counts = Counter(vuln.severity for vuln in vulnerabilities)
+
         for severity, count in severity_counts.items():
             print(f"   {severity.capitalize()}: {count}")
         
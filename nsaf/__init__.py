@@ -3,18 +3,36 @@ Network Security Assessment Framework (NSAF)
 A comprehensive network security assessment tool.
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "NSAF Team"
 __email__ = "contact@nsaf.security"
 
-from .core.scanner import NetworkScanner
-from .core.vulnerability_scanner import VulnerabilityScanner
-from .core.report_generator import ReportGenerator
-from .utils.logger import get_logger
+# PEP 562 lazy imports: the heavyweight scanner and reporting modules
+# (and their optional dependencies) are only loaded when first used, so
+# importing nsaf for the logger or CLI --help stays cheap
+_LAZY_IMPORTS = {
+    'NetworkScanner': 'nsaf.core.scanner',
+    'VulnerabilityScanner': 'nsaf.core.vulnerability_scanner',
+    'ReportGenerator': 'nsaf.core.report_generator',
+    'get_logger': 'nsaf.utils.logger'
+}
 
 __all__ = [
     'NetworkScanner',
-    'VulnerabilityScanner', 
+    'VulnerabilityScanner',
     'ReportGenerator',
     'get_logger'
 ]
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
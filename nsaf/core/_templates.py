@@ -0,0 +1,260 @@
+"""
+Default report templates shipped with NSAF.
+
+Kept in their own module so the multi-KB literals are only loaded when
+a ReportGenerator actually needs to materialize a template on disk.
+"""
+
+DEFAULT_HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ report_title }}</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 0 20px rgba(0,0,0,0.1);
+        }
+        .header {
+            text-align: center;
+            border-bottom: 3px solid #2c3e50;
+            padding-bottom: 20px;
+            margin-bottom: 30px;
+        }
+        .header h1 {
+            color: #2c3e50;
+            margin: 0;
+            font-size: 2.5em;
+        }
+        .header .subtitle {
+            color: #7f8c8d;
+            margin-top: 10px;
+        }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .summary-card {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 20px;
+            border-radius: 10px;
+            text-align: center;
+        }
+        .summary-card h3 {
+            margin: 0 0 10px 0;
+            font-size: 2em;
+        }
+        .severity-critical { background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%); }
+        .severity-high { background: linear-gradient(135deg, #ffa726 0%, #fb8c00 100%); }
+        .severity-medium { background: linear-gradient(135deg, #ffca28 0%, #ffc107 100%); }
+        .severity-low { background: linear-gradient(135deg, #66bb6a 0%, #4caf50 100%); }
+        
+        .section {
+            margin-bottom: 40px;
+        }
+        .section h2 {
+            color: #2c3e50;
+            border-bottom: 2px solid #3498db;
+            padding-bottom: 10px;
+        }
+        .vulnerability, .security-issue {
+            background: #f8f9fa;
+            border-left: 5px solid #3498db;
+            margin: 15px 0;
+            padding: 20px;
+            border-radius: 5px;
+        }
+        .vulnerability.critical {
+            border-left-color: #e74c3c;
+            background: #fdf2f2;
+        }
+        .vulnerability.high {
+            border-left-color: #f39c12;
+            background: #fef9e7;
+        }
+        .vulnerability.medium {
+            border-left-color: #f1c40f;
+            background: #fffbf0;
+        }
+        .vulnerability.low {
+            border-left-color: #27ae60;
+            background: #f0f9f0;
+        }
+        .vuln-title {
+            font-size: 1.2em;
+            font-weight: bold;
+            color: #2c3e50;
+            margin-bottom: 10px;
+        }
+        .vuln-meta {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 10px;
+            margin: 10px 0;
+            font-size: 0.9em;
+        }
+        .badge {
+            display: inline-block;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 0.8em;
+            font-weight: bold;
+            text-transform: uppercase;
+        }
+        .badge.critical { background: #e74c3c; color: white; }
+        .badge.high { background: #f39c12; color: white; }
+        .badge.medium { background: #f1c40f; color: #2c3e50; }
+        .badge.low { background: #27ae60; color: white; }
+        
+        .evidence {
+            background: #2c3e50;
+            color: #ecf0f1;
+            padding: 15px;
+            border-radius: 5px;
+            font-family: 'Courier New', monospace;
+            margin: 10px 0;
+            overflow-x: auto;
+        }
+        .recommendations {
+            background: #e8f5e8;
+            border: 1px solid #27ae60;
+            padding: 20px;
+            border-radius: 5px;
+        }
+        .recommendations ul {
+            margin: 0;
+            padding-left: 20px;
+        }
+        .footer {
+            text-align: center;
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 2px solid #ecf0f1;
+            color: #7f8c8d;
+        }
+        @media print {
+            body { background: white; }
+            .container { box-shadow: none; }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>{{ report_title }}</h1>
+            <div class="subtitle">
+                <strong>Assessment Date:</strong> {{ assessment_date }}<br>
+                <strong>Generated:</strong> {{ generation_date }}
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>Executive Summary</h2>
+            <div class="summary">
+                <div class="summary-card">
+                    <h3>{{ summary.total_vulnerabilities }}</h3>
+                    <p>Total Vulnerabilities</p>
+                </div>
+                <div class="summary-card severity-critical">
+                    <h3>{{ summary.severity_distribution.critical }}</h3>
+                    <p>Critical</p>
+                </div>
+                <div class="summary-card severity-high">
+                    <h3>{{ summary.severity_distribution.high }}</h3>
+                    <p>High</p>
+                </div>
+                <div class="summary-card severity-medium">
+                    <h3>{{ summary.severity_distribution.medium }}</h3>
+                    <p>Medium</p>
+                </div>
+                <div class="summary-card severity-low">
+                    <h3>{{ summary.severity_distribution.low }}</h3>
+                    <p>Low</p>
+                </div>
+            </div>
+        </div>
+
+        {% if vulnerabilities %}
+        <div class="section">
+            <h2>Vulnerabilities</h2>
+            {% for vuln in vulnerabilities %}
+            <div class="vulnerability {{ vuln.severity }}">
+                <div class="vuln-title">{{ vuln.title }}</div>
+                <div class="vuln-meta">
+                    <div><strong>Host:</strong> {{ vuln.host }}</div>
+                    <div><strong>Port:</strong> {{ vuln.port }}</div>
+                    <div><strong>Service:</strong> {{ vuln.affected_service }}</div>
+                    <div><strong>Severity:</strong> <span class="badge {{ vuln.severity }}">{{ vuln.severity }}</span></div>
+                    {% if vuln.cvss_score > 0 %}
+                    <div><strong>CVSS Score:</strong> {{ vuln.cvss_score }}</div>
+                    {% endif %}
+                </div>
+                <p><strong>Description:</strong> {{ vuln.description }}</p>
+                {% if vuln.evidence %}
+                <div class="evidence">{{ vuln.evidence }}</div>
+                {% endif %}
+                <p><strong>Remediation:</strong> {{ vuln.remediation }}</p>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+
+        {% if security_issues %}
+        <div class="section">
+            <h2>Security Issues</h2>
+            {% for issue in security_issues %}
+            <div class="security-issue">
+                <div class="vuln-title">{{ issue.title }}</div>
+                <div class="vuln-meta">
+                    <div><strong>Host:</strong> {{ issue.host }}</div>
+                    <div><strong>Service:</strong> {{ issue.service }}</div>
+                    <div><strong>Category:</strong> {{ issue.category }}</div>
+                    <div><strong>Risk Level:</strong> <span class="badge {{ issue.risk_level }}">{{ issue.risk_level }}</span></div>
+                </div>
+                <p><strong>Description:</strong> {{ issue.description }}</p>
+                {% if issue.evidence %}
+                <div class="evidence">{{ issue.evidence }}</div>
+                {% endif %}
+                <p><strong>Recommendation:</strong> {{ issue.recommendation }}</p>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+
+        {% if recommendations %}
+        <div class="section">
+            <h2>Recommendations</h2>
+            <div class="recommendations">
+                <ul>
+                {% for rec in recommendations %}
+                    <li>{{ rec }}</li>
+                {% endfor %}
+                </ul>
+            </div>
+        </div>
+        {% endif %}
+
+        <div class="footer">
+            <p>Generated by Network Security Assessment Framework (NSAF) v1.0.0</p>
+            <p>This report contains confidential security information</p>
+        </div>
+    </div>
+</body>
+</html>
+        """
@@ -0,0 +1,216 @@
+"""
+io_uring port-probe backend for NSAF (Linux only).
+Submits batches of non-blocking connect requests through a shared
+submission/completion ring so a full port sweep needs a handful of
+syscalls instead of one per probe.
+"""
+
+import errno
+import platform
+import socket
+from typing import List, Tuple
+
+try:
+    import liburing
+    LIBURING_AVAILABLE = platform.system().lower() == "linux"
+except ImportError:
+    LIBURING_AVAILABLE = False
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Number of connect SQEs submitted per ring cycle
+BATCH_SIZE = 1024
+
+# Completion codes that mean "host answered, port closed" rather than a
+# probe failure
+_CLOSED_ERRNOS = {-errno.ECONNREFUSED, -errno.ECONNRESET}
+
+# Payload sent on each new connection to elicit a banner
+_HTTP_PROBE = b"GET / HTTP/1.0\r\n\r\n"
+
+# Per-connection receive buffer size for banner grabs
+_BANNER_READ_SIZE = 1024
+
+# Each banner chain needs three SQEs (connect, send, recv), so batches
+# are smaller than the plain connect sweep
+_BANNER_BATCH = BATCH_SIZE // 4
+
+
+def is_available() -> bool:
+    """Return True if the io_uring backend can be used on this system"""
+    return LIBURING_AVAILABLE
+
+
+def probe_ports(target: str, ports: List[int], timeout: float = 3.0) -> List[int]:
+    """
+    Probe TCP ports on a target using io_uring batched connects
+
+    Args:
+        target: IP address or hostname to probe
+        ports: List of port numbers to test
+        timeout: Per-batch completion timeout in seconds
+
+    Returns:
+        List of open port numbers
+
+    Raises:
+        RuntimeError: If liburing is not available on this platform
+    """
+    if not LIBURING_AVAILABLE:
+        raise RuntimeError("io_uring backend requires liburing on Linux")
+
+    open_ports = []
+
+    for batch_start in range(0, len(ports), BATCH_SIZE):
+        batch = ports[batch_start:batch_start + BATCH_SIZE]
+        open_ports.extend(_probe_batch(target, batch, timeout))
+
+    return open_ports
+
+
+def grab_banners(target: str, ports: List[int], timeout: float = 3.0) -> dict:
+    """
+    Grab service banners using chained io_uring SQEs
+
+    Each port gets a connect -> send -> recv chain linked with
+    IOSQE_IO_LINK, so a failed connect cancels the rest of its chain and
+    a whole batch of banner grabs costs one submit syscall.
+
+    Args:
+        target: IP address or hostname to probe
+        ports: Open port numbers to banner-grab
+        timeout: Per-batch completion timeout in seconds
+
+    Returns:
+        Dict mapping port number to raw banner bytes
+
+    Raises:
+        RuntimeError: If liburing is not available on this platform
+    """
+    if not LIBURING_AVAILABLE:
+        raise RuntimeError("io_uring backend requires liburing on Linux")
+
+    banners = {}
+
+    for batch_start in range(0, len(ports), _BANNER_BATCH):
+        batch = ports[batch_start:batch_start + _BANNER_BATCH]
+        banners.update(_banner_batch(target, batch, timeout))
+
+    return banners
+
+
+def _banner_batch(target: str, ports: List[int], timeout: float) -> dict:
+    """Submit one ring cycle of linked connect/send/recv chains"""
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(len(ports) * 3, ring, 0)
+
+    sockets = {}
+    buffers = {}
+    banners = {}
+
+    try:
+        for port in ports:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            addr = liburing.sockaddr(socket.AF_INET, target.encode(), port)
+            buf = bytearray(_BANNER_READ_SIZE)
+            sockets[port] = (sock, addr)
+            buffers[port] = buf
+
+            # connect -> send -> recv; IO_LINK short-circuits the chain
+            # if an earlier step fails
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_connect(sqe, sock.fileno(), addr)
+            sqe.flags |= liburing.IOSQE_IO_LINK
+            sqe.user_data = (port << 2)
+
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_send(sqe, sock.fileno(), _HTTP_PROBE, len(_HTTP_PROBE), 0)
+            sqe.flags |= liburing.IOSQE_IO_LINK
+            sqe.user_data = (port << 2) | 1
+
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_recv(sqe, sock.fileno(), buf, _BANNER_READ_SIZE, 0)
+            sqe.user_data = (port << 2) | 2
+
+        liburing.io_uring_submit(ring)
+
+        cqe = liburing.io_uring_cqe()
+        timeout_spec = liburing.timespec(timeout)
+        for _ in range(len(ports) * 3):
+            try:
+                liburing.io_uring_wait_cqe_timeout(ring, cqe, timeout_spec)
+            except BlockingIOError:
+                break
+
+            port, op = cqe.user_data >> 2, cqe.user_data & 0x3
+            if op == 2 and cqe.res > 0:
+                banners[port] = bytes(buffers[port][:cqe.res])
+            elif cqe.res < 0 and cqe.res not in _CLOSED_ERRNOS and cqe.res != -errno.ECANCELED:
+                logger.debug(f"io_uring banner op {op} for {target}:{port} returned {cqe.res}")
+            liburing.io_uring_cqe_seen(ring, cqe)
+
+    except Exception as e:
+        logger.debug(f"io_uring banner batch failed for {target}: {e}")
+    finally:
+        for sock, _ in sockets.values():
+            try:
+                sock.close()
+            except OSError:
+                pass
+        liburing.io_uring_queue_exit(ring)
+
+    return banners
+
+
+def _probe_batch(target: str, ports: List[int], timeout: float) -> List[int]:
+    """Submit one ring cycle of connect SQEs and drain the completions"""
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(len(ports), ring, 0)
+
+    sockets = {}
+    open_ports = []
+
+    try:
+        # Fill the submission queue: one non-blocking connect per port
+        for port in ports:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            addr = liburing.sockaddr(socket.AF_INET, target.encode(), port)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_connect(sqe, sock.fileno(), addr)
+            sqe.user_data = port
+            sockets[port] = (sock, addr)
+
+        liburing.io_uring_submit(ring)
+
+        # Drain the completion queue
+        cqe = liburing.io_uring_cqe()
+        timeout_spec = liburing.timespec(timeout)
+        for _ in range(len(ports)):
+            try:
+                liburing.io_uring_wait_cqe_timeout(ring, cqe, timeout_spec)
+            except BlockingIOError:
+                # Remaining probes timed out; treat them as filtered
+                break
+
+            port = cqe.user_data
+            if cqe.res == 0:
+                open_ports.append(port)
+            elif cqe.res not in _CLOSED_ERRNOS:
+                logger.debug(f"io_uring probe {target}:{port} returned {cqe.res}")
+            liburing.io_uring_cqe_seen(ring, cqe)
+
+    except Exception as e:
+        logger.debug(f"io_uring batch failed for {target}: {e}")
+    finally:
+        for sock, _ in sockets.values():
+            try:
+                sock.close()
+            except OSError:
+                pass
+        liburing.io_uring_queue_exit(ring)
+
+    return sorted(open_ports)
@@ -3,19 +3,31 @@ Report generation module for NSAF.
 Generates comprehensive security assessment reports in multiple formats.
 """
 
+import csv
 import json
 import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import base64
 
 try:
-    from jinja2 import Template, Environment, FileSystemLoader
+    from jinja2 import Template, Environment, FileSystemLoader, FileSystemBytecodeCache
+    from markupsafe import escape
     JINJA2_AVAILABLE = True
 except ImportError:
     JINJA2_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from reportlab.lib.pagesizes import letter, A4
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
@@ -31,6 +43,68 @@ from .vulnerability_scanner import Vulnerability, SecurityIssue
 
 logger = get_logger(__name__)
 
+# Format shared by every default report filename
+_TIMESTAMP_FMT = "%Y%m%d_%H%M%S"
+
+# Process-wide singletons: every ReportGenerator in a process shares one
+# Jinja environment per template directory and one ReportLab style sheet,
+# so multi-instance workers compile templates and parse font metadata once
+_SHARED_LOCK = threading.Lock()
+_JINJA_ENVS: Dict[str, Any] = {}
+_INITIALIZED_DIRS: set = set()
+_PDF_STYLES = None
+_PDF_TITLE_STYLE = None
+
+def _get_jinja_env(template_dir: str, bytecode_dir: Path) -> Any:
+    """Return the shared Jinja Environment for a template directory"""
+    with _SHARED_LOCK:
+        env = _JINJA_ENVS.get(template_dir)
+        if env is None:
+            # Persist compiled template bytecode so later processes skip
+            # the parse/compile step entirely
+            bytecode_dir.mkdir(parents=True, exist_ok=True)
+            env = Environment(
+                loader=FileSystemLoader(template_dir),
+                autoescape=True,  # Enable autoescape to prevent XSS vulnerabilities
+                auto_reload=False,
+                cache_size=-1,
+                bytecode_cache=FileSystemBytecodeCache(directory=str(bytecode_dir))
+            )
+            _JINJA_ENVS[template_dir] = env
+        return env
+
+def _get_pdf_styles() -> Tuple[Any, Any]:
+    """Return the shared ReportLab style sheet and custom title style"""
+    global _PDF_STYLES, _PDF_TITLE_STYLE
+    with _SHARED_LOCK:
+        if _PDF_STYLES is None:
+            _PDF_STYLES = getSampleStyleSheet()
+            _PDF_TITLE_STYLE = ParagraphStyle(
+                'CustomTitle',
+                parent=_PDF_STYLES['Heading1'],
+                fontSize=24,
+                spaceAfter=30,
+                alignment=1  # Center
+            )
+        return _PDF_STYLES, _PDF_TITLE_STYLE
+
+def _ensure_dir(path: Path) -> None:
+    """mkdir once per process for each directory; later constructions
+    skip the syscall entirely"""
+    key = str(path)
+    if key not in _INITIALIZED_DIRS:
+        with _SHARED_LOCK:
+            if key not in _INITIALIZED_DIRS:
+                path.mkdir(parents=True, exist_ok=True)
+                _INITIALIZED_DIRS.add(key)
+
+def _filename_stamp(now: Optional[datetime] = None) -> str:
+    """Timestamp for default filenames; time.strftime is a direct C call
+    with no intermediate datetime object when no batch clock is given"""
+    if now is not None:
+        return now.strftime(_TIMESTAMP_FMT)
+    return time.strftime(_TIMESTAMP_FMT)
+
 class ReportGenerator:
     """Comprehensive report generator for security assessments"""
     
@@ -43,279 +117,38 @@ class ReportGenerator:
         """
         self.template_dir = template_dir or "templates"
         self.reports_dir = Path("reports")
-        self.reports_dir.mkdir(exist_ok=True)
-        
+        _ensure_dir(self.reports_dir)
+
         # Ensure templates directory exists
-        Path(self.template_dir).mkdir(exist_ok=True)
+        _ensure_dir(Path(self.template_dir))
         
         # Create default templates if they don't exist
         self._create_default_templates()
 
+        # All instances in the process share one environment per template
+        # directory; the compiled template is cached lazily on first use
+        self._jinja_env = None
+        self._html_template = None
+        if JINJA2_AVAILABLE:
+            self._jinja_env = _get_jinja_env(self.template_dir,
+                                             self.reports_dir / '.jinja_cache')
+
     def _create_default_templates(self) -> None:
         """Create default HTML report templates"""
-        template_path = Path(self.template_dir)
-        
-        # Main report template
-        main_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{ report_title }}</title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 0 20px rgba(0,0,0,0.1);
-        }
-        .header {
-            text-align: center;
-            border-bottom: 3px solid #2c3e50;
-            padding-bottom: 20px;
-            margin-bottom: 30px;
-        }
-        .header h1 {
-            color: #2c3e50;
-            margin: 0;
-            font-size: 2.5em;
-        }
-        .header .subtitle {
-            color: #7f8c8d;
-            margin-top: 10px;
-        }
-        .summary {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-        .summary-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            border-radius: 10px;
-            text-align: center;
-        }
-        .summary-card h3 {
-            margin: 0 0 10px 0;
-            font-size: 2em;
-        }
-        .severity-critical { background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%); }
-        .severity-high { background: linear-gradient(135deg, #ffa726 0%, #fb8c00 100%); }
-        .severity-medium { background: linear-gradient(135deg, #ffca28 0%, #ffc107 100%); }
-        .severity-low { background: linear-gradient(135deg, #66bb6a 0%, #4caf50 100%); }
-        
-        .section {
-            margin-bottom: 40px;
-        }
-        .section h2 {
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-        }
-        .vulnerability, .security-issue {
-            background: #f8f9fa;
-            border-left: 5px solid #3498db;
-            margin: 15px 0;
-            padding: 20px;
-            border-radius: 5px;
-        }
-        .vulnerability.critical {
-            border-left-color: #e74c3c;
-            background: #fdf2f2;
-        }
-        .vulnerability.high {
-            border-left-color: #f39c12;
-            background: #fef9e7;
-        }
-        .vulnerability.medium {
-            border-left-color: #f1c40f;
-            background: #fffbf0;
-        }
-        .vulnerability.low {
-            border-left-color: #27ae60;
-            background: #f0f9f0;
-        }
-        .vuln-title {
-            font-size: 1.2em;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }
-        .vuln-meta {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 10px;
-            margin: 10px 0;
-            font-size: 0.9em;
-        }
-        .badge {
-            display: inline-block;
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 0.8em;
-            font-weight: bold;
-            text-transform: uppercase;
-        }
-        .badge.critical { background: #e74c3c; color: white; }
-        .badge.high { background: #f39c12; color: white; }
-        .badge.medium { background: #f1c40f; color: #2c3e50; }
-        .badge.low { background: #27ae60; color: white; }
-        
-        .evidence {
-            background: #2c3e50;
-            color: #ecf0f1;
-            padding: 15px;
-            border-radius: 5px;
-            font-family: 'Courier New', monospace;
-            margin: 10px 0;
-            overflow-x: auto;
-        }
-        .recommendations {
-            background: #e8f5e8;
-            border: 1px solid #27ae60;
-            padding: 20px;
-            border-radius: 5px;
-        }
-        .recommendations ul {
-            margin: 0;
-            padding-left: 20px;
-        }
-        .footer {
-            text-align: center;
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 2px solid #ecf0f1;
-            color: #7f8c8d;
-        }
-        @media print {
-            body { background: white; }
-            .container { box-shadow: none; }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>{{ report_title }}</h1>
-            <div class="subtitle">
-                <strong>Assessment Date:</strong> {{ assessment_date }}<br>
-                <strong>Generated:</strong> {{ generation_date }}
-            </div>
-        </div>
+        template_file = Path(self.template_dir) / "report_template.html"
 
-        <div class="section">
-            <h2>Executive Summary</h2>
-            <div class="summary">
-                <div class="summary-card">
-                    <h3>{{ summary.total_vulnerabilities }}</h3>
-                    <p>Total Vulnerabilities</p>
-                </div>
-                <div class="summary-card severity-critical">
-                    <h3>{{ summary.severity_distribution.critical }}</h3>
-                    <p>Critical</p>
-                </div>
-                <div class="summary-card severity-high">
-                    <h3>{{ summary.severity_distribution.high }}</h3>
-                    <p>High</p>
-                </div>
-                <div class="summary-card severity-medium">
-                    <h3>{{ summary.severity_distribution.medium }}</h3>
-                    <p>Medium</p>
-                </div>
-                <div class="summary-card severity-low">
-                    <h3>{{ summary.severity_distribution.low }}</h3>
-                    <p>Low</p>
-                </div>
-            </div>
-        </div>
-
-        {% if vulnerabilities %}
-        <div class="section">
-            <h2>Vulnerabilities</h2>
-            {% for vuln in vulnerabilities %}
-            <div class="vulnerability {{ vuln.severity }}">
-                <div class="vuln-title">{{ vuln.title }}</div>
-                <div class="vuln-meta">
-                    <div><strong>Host:</strong> {{ vuln.host }}</div>
-                    <div><strong>Port:</strong> {{ vuln.port }}</div>
-                    <div><strong>Service:</strong> {{ vuln.affected_service }}</div>
-                    <div><strong>Severity:</strong> <span class="badge {{ vuln.severity }}">{{ vuln.severity }}</span></div>
-                    {% if vuln.cvss_score > 0 %}
-                    <div><strong>CVSS Score:</strong> {{ vuln.cvss_score }}</div>
-                    {% endif %}
-                </div>
-                <p><strong>Description:</strong> {{ vuln.description }}</p>
-                {% if vuln.evidence %}
-                <div class="evidence">{{ vuln.evidence }}</div>
-                {% endif %}
-                <p><strong>Remediation:</strong> {{ vuln.remediation }}</p>
-            </div>
-            {% endfor %}
-        </div>
-        {% endif %}
-
-        {% if security_issues %}
-        <div class="section">
-            <h2>Security Issues</h2>
-            {% for issue in security_issues %}
-            <div class="security-issue">
-                <div class="vuln-title">{{ issue.title }}</div>
-                <div class="vuln-meta">
-                    <div><strong>Host:</strong> {{ issue.host }}</div>
-                    <div><strong>Service:</strong> {{ issue.service }}</div>
-                    <div><strong>Category:</strong> {{ issue.category }}</div>
-                    <div><strong>Risk Level:</strong> <span class="badge {{ issue.risk_level }}">{{ issue.risk_level }}</span></div>
-                </div>
-                <p><strong>Description:</strong> {{ issue.description }}</p>
-                {% if issue.evidence %}
-                <div class="evidence">{{ issue.evidence }}</div>
-                {% endif %}
-                <p><strong>Recommendation:</strong> {{ issue.recommendation }}</p>
-            </div>
-            {% endfor %}
-        </div>
-        {% endif %}
-
-        {% if recommendations %}
-        <div class="section">
-            <h2>Recommendations</h2>
-            <div class="recommendations">
-                <ul>
-                {% for rec in recommendations %}
-                    <li>{{ rec }}</li>
-                {% endfor %}
-                </ul>
-            </div>
-        </div>
-        {% endif %}
-
-        <div class="footer">
-            <p>Generated by Network Security Assessment Framework (NSAF) v1.0.0</p>
-            <p>This report contains confidential security information</p>
-        </div>
-    </div>
-</body>
-</html>
-        """
-        
-        with open(template_path / "report_template.html", "w", encoding="utf-8") as f:
-            f.write(main_template)
+        # The template is written once; later constructions skip the I/O
+        # (and never import the literal at all)
+        if template_file.is_file():
+            return
+
+        from ._templates import DEFAULT_HTML_TEMPLATE
+        template_file.write_text(DEFAULT_HTML_TEMPLATE, encoding="utf-8")
 
-    def generate_html_report(self, assessment_results: Dict[str, Any], 
-                            filename: str = None, 
-                            title: str = "Network Security Assessment Report") -> str:
+    def generate_html_report(self, assessment_results: Dict[str, Any],
+                            filename: str = None,
+                            title: str = "Network Security Assessment Report",
+                            _now: Optional[datetime] = None) -> str:
         """
         Generate HTML report from assessment results
         
@@ -327,56 +160,72 @@ class ReportGenerator:
         Returns:
             Path to generated report file
         """
+        # The clock is read once per report (or taken from the caller in
+        # batch runs) so every artifact carries a consistent timestamp
+        now = _now or datetime.now()
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"security_assessment_report_{timestamp}.html"
-            
+            filename = f"security_assessment_report_{now.strftime(_TIMESTAMP_FMT)}.html"
+
         logger.info(f"Generating HTML report: {filename}")
-        
+
         if not JINJA2_AVAILABLE:
             logger.warning("Jinja2 not available, generating basic HTML report")
-            return self._generate_basic_html_report(assessment_results, filename, title)
-        
+            return self._generate_basic_html_report(assessment_results, filename, title, now)
+
         try:
-            # Load template with secure autoescape settings
-            env = Environment(
-                loader=FileSystemLoader(self.template_dir),
-                autoescape=True  # Enable autoescape to prevent XSS vulnerabilities
-            )
-            template = env.get_template("report_template.html")
-            
-            # Prepare template data
+            assessment_results = self._normalize_records(assessment_results)
+            # Compile the template once and reuse it on later calls
+            if self._html_template is None:
+                self._html_template = self._jinja_env.get_template("report_template.html")
+            template = self._html_template
+
+            # Escape every string field once up front; the resulting
+            # Markup values make Jinja's per-field autoescape a no-op
+            # during rendering
             template_data = {
                 'report_title': title,
-                'assessment_date': assessment_results.get('summary', {}).get('assessment_date', datetime.now().isoformat()),
-                'generation_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'assessment_date': assessment_results.get('summary', {}).get('assessment_date', now.isoformat()),
+                'generation_date': now.strftime("%Y-%m-%d %H:%M:%S"),
                 'summary': assessment_results.get('summary', {}),
-                'vulnerabilities': assessment_results.get('vulnerabilities', []),
-                'security_issues': assessment_results.get('security_issues', []),
-                'recommendations': assessment_results.get('recommendations', [])
+                'vulnerabilities': self._pre_escape(assessment_results.get('vulnerabilities', [])),
+                'security_issues': self._pre_escape(assessment_results.get('security_issues', [])),
+                'recommendations': [escape(r) for r in assessment_results.get('recommendations', [])]
             }
             
-            # Render template
-            html_content = template.render(**template_data)
-            
-            # Write to file
+            # Stream rendered chunks straight to disk instead of building
+            # the full document in memory first
+            # Render to a temp file and publish atomically so readers
+            # never observe a partially written report
             report_path = self.reports_dir / filename
-            with open(report_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-                
+            tmp_path = report_path.with_suffix(report_path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                template.stream(**template_data).dump(f)
+            os.replace(tmp_path, report_path)
+
             logger.info(f"HTML report generated successfully: {report_path}")
             return str(report_path)
             
         except Exception as e:
             logger.error(f"Failed to generate HTML report: {e}")
-            return self._generate_basic_html_report(assessment_results, filename, title)
+            return self._generate_basic_html_report(assessment_results, filename, title, now)
 
-    def _generate_basic_html_report(self, assessment_results: Dict[str, Any], 
-                                   filename: str, title: str) -> str:
+    def _generate_basic_html_report(self, assessment_results: Dict[str, Any],
+                                   filename: str, title: str,
+                                   now: Optional[datetime] = None) -> str:
         """Generate basic HTML report without Jinja2"""
         logger.info("Generating basic HTML report")
+
+        if now is None:
+            now = datetime.now()
+        assessment_results = self._normalize_records(assessment_results)
         
-        html_content = f"""
+        report_path = self.reports_dir / filename
+        tmp_path = report_path.with_suffix(report_path.suffix + '.tmp')
+
+        # Emit each fragment straight to the buffered file handle so the
+        # full document is never assembled in memory
+        with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -395,7 +244,7 @@ class ReportGenerator:
         <body>
             <div class="header">
                 <h1>{title}</h1>
-                <p>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
+                <p>Generated: {now.strftime("%Y-%m-%d %H:%M:%S")}</p>
             </div>
             
             <div class="summary">
@@ -403,34 +252,34 @@ class ReportGenerator:
                 <p>Total Vulnerabilities: {len(assessment_results.get('vulnerabilities', []))}</p>
                 <p>Security Issues: {len(assessment_results.get('security_issues', []))}</p>
             </div>
-        """
-        
-        # Add vulnerabilities
-        vulnerabilities = assessment_results.get('vulnerabilities', [])
-        if vulnerabilities:
-            html_content += "<h2>Vulnerabilities</h2>"
-            for vuln in vulnerabilities:
-                html_content += f"""
-                <div class="vulnerability {vuln.severity}">
-                    <h3>{vuln.title}</h3>
-                    <p><strong>Host:</strong> {vuln.host}:{vuln.port}</p>
-                    <p><strong>Severity:</strong> {vuln.severity}</p>
-                    <p><strong>Description:</strong> {vuln.description}</p>
-                    <p><strong>Remediation:</strong> {vuln.remediation}</p>
+        """)
+
+            # Add vulnerabilities
+            vulnerabilities = assessment_results.get('vulnerabilities', [])
+            if vulnerabilities:
+                f.write("<h2>Vulnerabilities</h2>")
+                # User-supplied JSON may omit fields; render them empty
+                # rather than failing the whole report
+                for vuln in vulnerabilities:
+                    f.write(f"""
+                <div class="vulnerability {vuln.get('severity', '')}">
+                    <h3>{vuln.get('title', '')}</h3>
+                    <p><strong>Host:</strong> {vuln.get('host', '')}:{vuln.get('port', '')}</p>
+                    <p><strong>Severity:</strong> {vuln.get('severity', '')}</p>
+                    <p><strong>Description:</strong> {vuln.get('description', '')}</p>
+                    <p><strong>Remediation:</strong> {vuln.get('remediation', '')}</p>
                 </div>
-                """
-        
-        html_content += "</body></html>"
-        
-        report_path = self.reports_dir / filename
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-            
+                """)
+
+            f.write("</body></html>")
+
+        os.replace(tmp_path, report_path)
         return str(report_path)
 
-    def generate_pdf_report(self, assessment_results: Dict[str, Any], 
+    def generate_pdf_report(self, assessment_results: Dict[str, Any],
                            filename: str = None,
-                           title: str = "Network Security Assessment Report") -> str:
+                           title: str = "Network Security Assessment Report",
+                           _now: Optional[datetime] = None) -> str:
         """
         Generate PDF report from assessment results
         
@@ -447,25 +296,22 @@ class ReportGenerator:
             return ""
             
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"security_assessment_report_{timestamp}.pdf"
+            filename = f"security_assessment_report_{_filename_stamp(_now)}.pdf"
             
         logger.info(f"Generating PDF report: {filename}")
         
         try:
+            assessment_results = self._normalize_records(assessment_results)
             report_path = self.reports_dir / filename
-            doc = SimpleDocTemplate(str(report_path), pagesize=A4)
-            styles = getSampleStyleSheet()
+            tmp_path = report_path.with_suffix(report_path.suffix + '.tmp')
+            doc = SimpleDocTemplate(str(tmp_path), pagesize=A4)
+
+            # Style sheets are shared process-wide; building them parses
+            # font and color metadata, so it happens once per process
+            styles, title_style = _get_pdf_styles()
             story = []
-            
+
             # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                spaceAfter=30,
-                alignment=1  # Center
-            )
             story.append(Paragraph(title, title_style))
             story.append(Spacer(1, 20))
             
@@ -497,21 +343,41 @@ class ReportGenerator:
             story.append(summary_table)
             story.append(Spacer(1, 20))
             
-            # Vulnerabilities
+            # Vulnerabilities rendered as one batched table instead of
+            # six flowables per finding; ReportLab lays the rows out in a
+            # single pass and repeats the header across page breaks
             vulnerabilities = assessment_results.get('vulnerabilities', [])
             if vulnerabilities:
                 story.append(Paragraph("Vulnerabilities", styles['Heading2']))
-                
-                for vuln in vulnerabilities:
-                    story.append(Paragraph(f"<b>{vuln.title}</b>", styles['Heading3']))
-                    story.append(Paragraph(f"<b>Host:</b> {vuln.host}:{vuln.port}", styles['Normal']))
-                    story.append(Paragraph(f"<b>Severity:</b> {vuln.severity}", styles['Normal']))
-                    story.append(Paragraph(f"<b>Description:</b> {vuln.description}", styles['Normal']))
-                    story.append(Paragraph(f"<b>Remediation:</b> {vuln.remediation}", styles['Normal']))
-                    story.append(Spacer(1, 12))
+
+                vuln_rows = [['Title', 'Host', 'Severity', 'Description', 'Remediation']]
+                vuln_rows.extend(
+                    [vuln.get('title', ''),
+                     f"{vuln.get('host', '')}:{vuln.get('port', '')}",
+                     vuln.get('severity', ''), vuln.get('description', ''),
+                     vuln.get('remediation', '')]
+                    for vuln in vulnerabilities
+                )
+
+                vuln_table = Table(
+                    vuln_rows,
+                    repeatRows=1,
+                    colWidths=[1.2 * inch, 1.1 * inch, 0.8 * inch, 2.0 * inch, 2.0 * inch]
+                )
+                vuln_table.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTSIZE', (0, 0), (-1, -1), 8),
+                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                    ('GRID', (0, 0), (-1, -1), 0.5, colors.black)
+                ]))
+                story.append(vuln_table)
+                story.append(Spacer(1, 12))
             
             # Build PDF
             doc.build(story)
+            os.replace(tmp_path, report_path)
             logger.info(f"PDF report generated successfully: {report_path}")
             return str(report_path)
             
@@ -519,8 +385,9 @@ class ReportGenerator:
             logger.error(f"Failed to generate PDF report: {e}")
             return ""
 
-    def generate_json_report(self, assessment_results: Dict[str, Any], 
-                            filename: str = None) -> str:
+    def generate_json_report(self, assessment_results: Dict[str, Any],
+                            filename: str = None,
+                            _now: Optional[datetime] = None) -> str:
         """
         Generate JSON report from assessment results
         
@@ -532,19 +399,28 @@ class ReportGenerator:
             Path to generated report file
         """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"security_assessment_report_{timestamp}.json"
+            filename = f"security_assessment_report_{_filename_stamp(_now)}.json"
             
         logger.info(f"Generating JSON report: {filename}")
         
         try:
-            # Convert datetime objects to strings for JSON serialization
-            json_data = self._prepare_json_data(assessment_results)
-            
+            assessment_results = self._normalize_records(assessment_results)
             report_path = self.reports_dir / filename
-            with open(report_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
-                
+            tmp_path = report_path.with_suffix(report_path.suffix + '.tmp')
+            # The serializers call _json_default only for objects they
+            # cannot encode natively, so the common strings/dicts/lists
+            # path is zero-copy instead of a full pre-traversal rewrite
+            if ORJSON_AVAILABLE:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(assessment_results,
+                                         default=self._json_default,
+                                         option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    json.dump(assessment_results, f, indent=2,
+                              ensure_ascii=False, default=self._json_default)
+            os.replace(tmp_path, report_path)
+
             logger.info(f"JSON report generated successfully: {report_path}")
             return str(report_path)
             
@@ -552,23 +428,62 @@ class ReportGenerator:
             logger.error(f"Failed to generate JSON report: {e}")
             return ""
 
-    def _prepare_json_data(self, data: Any) -> Any:
-        """Prepare data for JSON serialization"""
-        if isinstance(data, dict):
-            return {k: self._prepare_json_data(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._prepare_json_data(item) for item in data]
-        elif isinstance(data, (Vulnerability, SecurityIssue)):
-            return data.__dict__
+    @staticmethod
+    def _pre_escape(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """HTML-escape the string fields of normalized records once"""
+        return [
+            {k: (escape(v) if isinstance(v, str) else v) for k, v in record.items()}
+            for record in records
+        ]
+
+    def _normalize_records(self, assessment_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert dataclass records to plain dicts in a single pass
+
+        Every report format renders the same vulnerability and
+        security-issue lists, so the attribute lookups and timestamp
+        formatting are done once here instead of once per format.
+        Already-normalized payloads pass through unchanged.
+        """
+        normalized = dict(assessment_results)
+        for key in ('vulnerabilities', 'security_issues'):
+            records = normalized.get(key)
+            if records and not isinstance(records[0], dict):
+                normalized[key] = [record.to_dict() for record in records]
+
+        # Count severities once here so every format sees a complete
+        # distribution even when the caller's summary omitted it;
+        # caller-supplied values still win on key collisions
+        vulns = normalized.get('vulnerabilities', [])
+        # User-supplied records may omit severity; unknowns simply fall
+        # outside the fixed buckets instead of failing the report
+        sev = Counter(vuln.get('severity') for vuln in vulns)
+        normalized['summary'] = {
+            'total_vulnerabilities': len(vulns),
+            'severity_distribution': {
+                'critical': sev.get('critical', 0),
+                'high': sev.get('high', 0),
+                'medium': sev.get('medium', 0),
+                'low': sev.get('low', 0)
+            },
+            **assessment_results.get('summary', {})
+        }
+        return normalized
+
+    @staticmethod
+    def _json_default(data: Any) -> Any:
+        """Fallback encoder for objects json/orjson cannot serialize"""
+        if isinstance(data, (Vulnerability, SecurityIssue)):
+            # Slotted dataclasses have no __dict__; they know their own shape
+            return data.to_dict()
         elif isinstance(data, datetime):
             return data.isoformat()
         elif isinstance(data, set):
             return list(data)
-        else:
-            return data
+        raise TypeError(f"Object of type {type(data).__name__} is not JSON serializable")
 
-    def generate_csv_report(self, assessment_results: Dict[str, Any], 
-                           filename: str = None) -> str:
+    def generate_csv_report(self, assessment_results: Dict[str, Any],
+                           filename: str = None,
+                           _now: Optional[datetime] = None) -> str:
         """
         Generate CSV report from assessment results
         
@@ -580,53 +495,51 @@ class ReportGenerator:
             Path to generated report file
         """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"security_assessment_report_{timestamp}.csv"
+            filename = f"security_assessment_report_{_filename_stamp(_now)}.csv"
             
         logger.info(f"Generating CSV report: {filename}")
         
         try:
-            import csv
-            
+            assessment_results = self._normalize_records(assessment_results)
             report_path = self.reports_dir / filename
-            
-            with open(report_path, 'w', newline='', encoding='utf-8') as csvfile:
+            tmp_path = report_path.with_suffix(report_path.suffix + '.tmp')
+
+            with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
-                
+
                 # Write header
                 writer.writerow([
-                    'Type', 'Title', 'Host', 'Port', 'Severity/Risk', 
+                    'Type', 'Title', 'Host', 'Port', 'Severity/Risk',
                     'Service', 'Description', 'Remediation', 'Timestamp'
                 ])
-                
-                # Write vulnerabilities
-                for vuln in assessment_results.get('vulnerabilities', []):
-                    writer.writerow([
-                        'Vulnerability',
-                        vuln.title,
-                        vuln.host,
-                        vuln.port,
-                        vuln.severity,
-                        vuln.affected_service,
-                        vuln.description,
-                        vuln.remediation,
-                        vuln.timestamp.isoformat() if hasattr(vuln.timestamp, 'isoformat') else str(vuln.timestamp)
-                    ])
-                
-                # Write security issues
-                for issue in assessment_results.get('security_issues', []):
-                    writer.writerow([
-                        'Security Issue',
-                        issue.title,
-                        issue.host,
-                        '',  # No port for security issues
-                        issue.risk_level,
-                        issue.service,
-                        issue.description,
-                        issue.recommendation,
-                        issue.timestamp.isoformat() if hasattr(issue.timestamp, 'isoformat') else str(issue.timestamp)
-                    ])
-            
+
+                # Stream rows from generators so no full row list is
+                # materialized; the file buffer batches the writes
+                writer.writerows((
+                    'Vulnerability',
+                    vuln.get('title', ''),
+                    vuln.get('host', ''),
+                    vuln.get('port', ''),
+                    vuln.get('severity', ''),
+                    vuln.get('affected_service', ''),
+                    vuln.get('description', ''),
+                    vuln.get('remediation', ''),
+                    vuln.get('timestamp', '')
+                ) for vuln in assessment_results.get('vulnerabilities', []))
+
+                writer.writerows((
+                    'Security Issue',
+                    issue.get('title', ''),
+                    issue.get('host', ''),
+                    '',  # No port for security issues
+                    issue.get('risk_level', ''),
+                    issue.get('service', ''),
+                    issue.get('description', ''),
+                    issue.get('recommendation', ''),
+                    issue.get('timestamp', '')
+                ) for issue in assessment_results.get('security_issues', []))
+
+            os.replace(tmp_path, report_path)
             logger.info(f"CSV report generated successfully: {report_path}")
             return str(report_path)
             
@@ -646,33 +559,57 @@ class ReportGenerator:
         Returns:
             Dictionary mapping format to file path
         """
+        now = datetime.now()
         if base_filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_filename = f"security_assessment_report_{timestamp}"
+            base_filename = f"security_assessment_report_{now.strftime(_TIMESTAMP_FMT)}"
             
         logger.info("Generating all report formats")
-        
+
+        # Flatten the dataclass records once; each format then renders
+        # the same normalized payload instead of re-walking the objects.
+        # On bad input fall through with the raw payload - each format
+        # re-normalizes inside its own error handling
+        try:
+            assessment_results = self._normalize_records(assessment_results)
+        except Exception as e:
+            logger.warning(f"Could not normalize assessment results: {e}")
+
+        generators = {
+            'html': (self.generate_html_report, f"{base_filename}.html"),
+            'pdf': (self.generate_pdf_report, f"{base_filename}.pdf"),
+            'json': (self.generate_json_report, f"{base_filename}.json"),
+            'csv': (self.generate_csv_report, f"{base_filename}.csv")
+        }
+
         report_files = {}
-        
-        # Generate HTML report
-        html_file = self.generate_html_report(assessment_results, f"{base_filename}.html")
-        if html_file:
-            report_files['html'] = html_file
-            
-        # Generate PDF report
-        pdf_file = self.generate_pdf_report(assessment_results, f"{base_filename}.pdf")
-        if pdf_file:
-            report_files['pdf'] = pdf_file
-            
-        # Generate JSON report
-        json_file = self.generate_json_report(assessment_results, f"{base_filename}.json")
-        if json_file:
-            report_files['json'] = json_file
-            
-        # Generate CSV report
-        csv_file = self.generate_csv_report(assessment_results, f"{base_filename}.csv")
-        if csv_file:
-            report_files['csv'] = csv_file
-            
+
+        # Compile the template on this thread first; Jinja environment
+        # setup is not guaranteed thread-safe, rendering is
+        if JINJA2_AVAILABLE and self._html_template is None:
+            try:
+                self._html_template = self._jinja_env.get_template("report_template.html")
+            except Exception as e:
+                logger.debug(f"Template precompilation failed: {e}")
+
+        # The four writers are independent and spend their time in disk
+        # I/O and C-level rendering, so overlap them with threads
+        try:
+            with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+                futures = {
+                    format_type: executor.submit(generate, assessment_results, filename, _now=now)
+                    for format_type, (generate, filename) in generators.items()
+                }
+                for format_type, future in futures.items():
+                    report_file = future.result()
+                    if report_file:
+                        report_files[format_type] = report_file
+        except Exception as e:
+            logger.warning(f"Parallel report generation failed, falling back to sequential: {e}")
+            report_files = {}
+            for format_type, (generate, filename) in generators.items():
+                report_file = generate(assessment_results, filename, _now=now)
+                if report_file:
+                    report_files[format_type] = report_file
+
         logger.info(f"Generated {len(report_files)} report files")
         return report_files
@@ -3,24 +3,120 @@ Vulnerability scanner module for NSAF.
 Identifies security vulnerabilities and misconfigurations.
 """
 
+import functools
 import re
 import socket
 import ssl
+import sys
 import subprocess  # nosec B404 - subprocess usage is validated and secure
 import json
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from collections import Counter
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 import requests
 from urllib.parse import urljoin
 import concurrent.futures
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from ..utils.logger import get_logger
+from ..utils.cache import ScanCache
 from .scanner import ScanResult, HostInfo
 
 logger = get_logger(__name__)
 
-@dataclass
+@functools.cache
+def _field_names(cls) -> Tuple[str, ...]:
+    """Field-name tuple for a dataclass type, resolved once per type
+
+    dataclasses.fields() rebuilds its tuple on every call; reports call
+    to_dict once per finding, so the schema lookup is cached here and
+    each record only pays for the getattr walk.
+    """
+    return tuple(f.name for f in fields(cls))
+
+class SignatureAutomaton:
+    """
+    Aho-Corasick automaton for matching many signatures against banners
+    in a single pass. Uses the pyahocorasick C extension when installed
+    and falls back to a pure-Python goto/fail table otherwise.
+    """
+
+    def __init__(self, patterns: List[str]):
+        """
+        Build the automaton from a list of lowercase patterns
+
+        Args:
+            patterns: Substring signatures to match
+        """
+        self.patterns = list(patterns)
+
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for pattern in self.patterns:
+                self._automaton.add_word(pattern, pattern)
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            self._build_tables()
+
+    def _build_tables(self) -> None:
+        """Build goto, fail and output tables for the pure-Python matcher"""
+        self._goto = [{}]
+        self._output = [set()]
+
+        for pattern in self.patterns:
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    self._goto.append({})
+                    self._output.append(set())
+                    next_state = len(self._goto) - 1
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].add(pattern)
+
+        # BFS to fill the failure links
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        while queue:
+            state = queue.pop(0)
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str):
+        """Yield every matching pattern found in text (single pass)"""
+        if self._automaton is not None:
+            for _, pattern in self._automaton.iter(text):
+                yield pattern
+            return
+
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern in self._output[state]:
+                yield pattern
+
+    def search(self, text: str) -> bool:
+        """Return True if any signature occurs in text"""
+        return next(self.iter_matches(text), None) is not None
+
+@dataclass(slots=True, frozen=True)
 class Vulnerability:
     """Data class for vulnerability information"""
     vuln_id: str
@@ -37,7 +133,21 @@ class Vulnerability:
     references: List[str] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
 
-@dataclass 
+    def __post_init__(self):
+        # Findings repeat severities, hosts and service names; interning
+        # shares storage and turns the severity comparisons in the summary
+        # loops into pointer checks (object.__setattr__ because frozen)
+        object.__setattr__(self, 'severity', sys.intern(self.severity))
+        object.__setattr__(self, 'host', sys.intern(self.host))
+        object.__setattr__(self, 'affected_service', sys.intern(self.affected_service))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the finding as a plain dict with an ISO timestamp"""
+        return {name: (value.isoformat() if isinstance(value := getattr(self, name), datetime)
+                       else value)
+                for name in _field_names(type(self))}
+
+@dataclass(slots=True, frozen=True)
 class SecurityIssue:
     """Data class for security configuration issues"""
     issue_id: str
@@ -51,19 +161,46 @@ class SecurityIssue:
     recommendation: str
     timestamp: datetime = field(default_factory=datetime.now)
 
+    def __post_init__(self):
+        object.__setattr__(self, 'risk_level', sys.intern(self.risk_level))
+        object.__setattr__(self, 'host', sys.intern(self.host))
+        object.__setattr__(self, 'service', sys.intern(self.service))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the issue as a plain dict with an ISO timestamp"""
+        return {name: (value.isoformat() if isinstance(value := getattr(self, name), datetime)
+                       else value)
+                for name in _field_names(type(self))}
+
+# Banner keywords that indicate version information disclosure, compiled
+# once so each banner is scanned in a single pass regardless of how many
+# signatures are registered
+BANNER_DISCLOSURE_SIGNATURES = SignatureAutomaton([
+    'version', 'server', 'apache', 'nginx', 'iis'
+])
+
+# Port tables used by the per-host checks, hoisted to module level so they
+# are built once; frozenset membership is an O(1) hash lookup
+SSL_PORTS = frozenset({443, 993, 995, 8443})
+WEB_PORTS = frozenset({80, 443, 8080, 8443, 8000, 8888})
+DANGEROUS_PORTS = frozenset({23, 135, 139, 445, 1433, 1521, 3306, 5432})
+
 class VulnerabilityScanner:
     """Comprehensive vulnerability scanner"""
-    
-    def __init__(self, timeout: int = 10, verify_ssl: bool = True):
+
+    def __init__(self, timeout: int = 10, verify_ssl: bool = True,
+                 cache: Optional[ScanCache] = None):
         """
         Initialize VulnerabilityScanner
-        
+
         Args:
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates (default: True for security)
+            cache: Optional result cache shared between runs
         """
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.cache = cache
         self.vulnerabilities = []
         self.security_issues = []
         
@@ -72,6 +209,9 @@ class VulnerabilityScanner:
         
         # Load vulnerability database
         self.vuln_db = self._load_vulnerability_database()
+        # Direct service->rule index so the per-port hot loop does one
+        # hash probe instead of re-walking the database dict
+        self._weak_protocol_rules = self.vuln_db['weak_protocols']
         
     def _load_vulnerability_database(self) -> Dict[str, Any]:
         """Load vulnerability signatures and patterns"""
@@ -106,7 +246,20 @@ class VulnerabilityScanner:
             Dictionary containing vulnerability assessment results
         """
         logger.info("Starting vulnerability assessment")
-        
+
+        cache_key = None
+        if self.cache is not None and self.cache.enabled:
+            cache_key = self.cache.make_key(
+                "assess",
+                repr(sorted((h, tuple(r.port for r in rs))
+                            for h, rs in scan_results.items())))
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached vulnerability assessment")
+                self.vulnerabilities = cached['vulnerabilities']
+                self.security_issues = cached['security_issues']
+                return cached
+
         assessment_results = {
             'vulnerabilities': [],
             'security_issues': [],
@@ -114,34 +267,61 @@ class VulnerabilityScanner:
             'recommendations': []
         }
         
-        for host, results in scan_results.items():
-            logger.info(f"Assessing vulnerabilities for {host}")
-            
-            # Check for various vulnerability types
-            self._check_weak_protocols(host, results)
-            self._check_ssl_vulnerabilities(host, results)
-            self._check_web_vulnerabilities(host, results)
-            self._check_default_credentials(host, results)
-            self._check_information_disclosure(host, results)
-            self._check_misconfigurations(host, results)
-            
+        # The per-host checks are independent and mostly network-bound
+        # (SSL handshakes, HTTP probes, connect attempts), so they run
+        # concurrently and the wall time collapses toward the slowest
+        # check instead of their sum. Appends to the shared finding
+        # lists are atomic under the GIL; results are re-sorted below so
+        # output stays deterministic.
+        checks = (
+            self._check_weak_protocols,
+            self._check_ssl_vulnerabilities,
+            self._check_web_vulnerabilities,
+            self._check_default_credentials,
+            self._check_information_disclosure,
+            self._check_misconfigurations,
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=32) as executor:
+            futures = []
+            for host, results in scan_results.items():
+                logger.info(f"Assessing vulnerabilities for {host}")
+                futures.extend(executor.submit(check, host, results)
+                               for check in checks)
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(f"Vulnerability check failed: {e}")
+
+        self.vulnerabilities.sort(key=lambda v: (v.host, v.port, v.vuln_id))
+        self.security_issues.sort(key=lambda i: (i.host, i.issue_id))
+
         assessment_results['vulnerabilities'] = self.vulnerabilities
         assessment_results['security_issues'] = self.security_issues
         assessment_results['summary'] = self._generate_summary()
         assessment_results['recommendations'] = self._generate_recommendations()
         
         logger.info(f"Assessment complete. Found {len(self.vulnerabilities)} vulnerabilities and {len(self.security_issues)} security issues")
-        
+
+        if cache_key is not None:
+            self.cache.set(cache_key, assessment_results)
+
         return assessment_results
 
     def _check_weak_protocols(self, host: str, results: List[ScanResult]) -> None:
         """Check for weak or insecure protocols"""
+        rules = self._weak_protocol_rules
+        # Group results by service and intersect with the rule set, so a
+        # host with hundreds of open ports does one C-level set operation
+        # instead of a dict probe per result
+        by_service: Dict[str, List[ScanResult]] = {}
         for result in results:
-            service = result.service.lower()
-            
-            if service in self.vuln_db['weak_protocols']:
-                vuln_info = self.vuln_db['weak_protocols'][service]
-                
+            by_service.setdefault(result.service.lower(), []).append(result)
+
+        found = []
+        for service in rules.keys() & by_service.keys():
+            vuln_info = rules[service]
+            for result in by_service[service]:
                 vulnerability = Vulnerability(
                     vuln_id=f"WEAK_PROTO_{service.upper()}_{host}_{result.port}",
                     title=f"Insecure Protocol: {service.upper()}",
@@ -156,14 +336,16 @@ class VulnerabilityScanner:
                         "https://owasp.org/www-community/vulnerabilities/Insecure_Transport"
                     ]
                 )
-                self.vulnerabilities.append(vulnerability)
+                found.append(vulnerability)
+
+        # One extend amortizes the shared-list growth and keeps the
+        # concurrent checks from interleaving their appends
+        self.vulnerabilities.extend(found)
 
     def _check_ssl_vulnerabilities(self, host: str, results: List[ScanResult]) -> None:
         """Check for SSL/TLS vulnerabilities"""
-        ssl_ports = [443, 993, 995, 8443]
-        
         for result in results:
-            if result.port in ssl_ports or 'ssl' in result.service.lower() or 'tls' in result.service.lower():
+            if result.port in SSL_PORTS or 'ssl' in result.service.lower() or 'tls' in result.service.lower():
                 try:
                     # Check SSL configuration
                     ssl_issues = self._analyze_ssl_configuration(host, result.port)
@@ -250,10 +432,8 @@ class VulnerabilityScanner:
 
     def _check_web_vulnerabilities(self, host: str, results: List[ScanResult]) -> None:
         """Check for web application vulnerabilities"""
-        web_ports = [80, 443, 8080, 8443, 8000, 8888]
-        
         for result in results:
-            if result.port in web_ports or 'http' in result.service.lower():
+            if result.port in WEB_PORTS or 'http' in result.service.lower():
                 try:
                     base_url = f"{'https' if result.port == 443 or 'https' in result.service else 'http'}://{host}:{result.port}"
                     
@@ -399,7 +579,7 @@ class VulnerabilityScanner:
         for result in results:
             if result.banner:
                 # Check for version information in banners
-                if any(keyword in result.banner.lower() for keyword in ['version', 'server', 'apache', 'nginx', 'iis']):
+                if BANNER_DISCLOSURE_SIGNATURES.search(result.banner.lower()):
                     security_issue = SecurityIssue(
                         issue_id=f"INFO_DISCLOSURE_{host}_{result.port}",
                         category="Information Disclosure",
@@ -418,9 +598,8 @@ class VulnerabilityScanner:
         open_ports = [r.port for r in results]
         
         # Check for unnecessary services
-        dangerous_ports = [23, 135, 139, 445, 1433, 1521, 3306, 5432]
         for port in open_ports:
-            if port in dangerous_ports:
+            if port in DANGEROUS_PORTS:
                 security_issue = SecurityIssue(
                     issue_id=f"DANGEROUS_PORT_{port}_{host}",
                     category="Network Security",
@@ -436,29 +615,21 @@ class VulnerabilityScanner:
 
     def _generate_summary(self) -> Dict[str, Any]:
         """Generate vulnerability assessment summary"""
+        # Counter tallies severities in one C-level pass; the host set
+        # is sorted for JSON serialization and deterministic reports
+        severity_counts = Counter(vuln.severity for vuln in self.vulnerabilities)
         summary = {
             'total_vulnerabilities': len(self.vulnerabilities),
             'total_security_issues': len(self.security_issues),
             'severity_distribution': {
-                'critical': 0,
-                'high': 0,
-                'medium': 0,
-                'low': 0,
-                'info': 0
+                severity: severity_counts.get(severity, 0)
+                for severity in ('critical', 'high', 'medium', 'low', 'info')
             },
             'top_risks': [],
-            'affected_hosts': set(),
+            'affected_hosts': sorted({vuln.host for vuln in self.vulnerabilities}),
             'assessment_date': datetime.now().isoformat()
         }
         
-        # Count vulnerabilities by severity
-        for vuln in self.vulnerabilities:
-            summary['severity_distribution'][vuln.severity] += 1
-            summary['affected_hosts'].add(vuln.host)
-            
-        # Convert set to list for JSON serialization
-        summary['affected_hosts'] = list(summary['affected_hosts'])
-        
         # Identify top risks
         critical_high_vulns = [v for v in self.vulnerabilities if v.severity in ['critical', 'high']]
         summary['top_risks'] = sorted(critical_high_vulns, key=lambda x: x.cvss_score, reverse=True)[:5]
@@ -3,8 +3,10 @@ Utilities module for NSAF
 """
 
 from .logger import get_logger, setup_logging
+from .cache import ScanCache
 
 __all__ = [
     'get_logger',
-    'setup_logging'
+    'setup_logging',
+    'ScanCache'
 ]
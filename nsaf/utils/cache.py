@@ -0,0 +1,118 @@
+"""
+Result caching for NSAF
+Caches scan and assessment results between runs so repeated invocations
+against the same targets skip the network I/O. Redis is used when
+available; otherwise results persist in a local SQLite file.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from typing import Any, Optional
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+class ScanCache:
+    """Cache for scan and vulnerability assessment results
+
+    Prefers Redis when the package is installed and a server answers;
+    otherwise falls back to a local SQLite file so cached results still
+    survive between runs with no external service.
+    """
+
+    def __init__(self, host: Optional[str] = None, port: int = 6379,
+                 ttl: int = 3600, db_path: Optional[str] = None):
+        """
+        Initialize ScanCache
+
+        Args:
+            host: Redis host (default: NSAF_REDIS_HOST env var or localhost)
+            port: Redis port
+            ttl: Cache entry lifetime in seconds
+            db_path: SQLite fallback file (default: .nsaf_cache.sqlite)
+        """
+        self.ttl = ttl
+        self._redis = None
+        self._db = None
+
+        if REDIS_AVAILABLE:
+            host = host or os.getenv("NSAF_REDIS_HOST", "localhost")
+            try:
+                client = redis.Redis(host=host, port=port, socket_connect_timeout=1)
+                client.ping()
+                self._redis = client
+                logger.info(f"Result cache connected to Redis at {host}:{port}")
+                return
+            except Exception as e:
+                logger.debug(f"Redis unavailable at {host}:{port}: {e}")
+        else:
+            logger.debug("redis package not installed")
+
+        db_path = db_path or ".nsaf_cache.sqlite"
+        try:
+            db = sqlite3.connect(db_path, check_same_thread=False)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB, expires REAL)"
+            )
+            db.commit()
+            self._db = db
+            logger.info(f"Result cache using SQLite at {db_path}")
+        except Exception as e:
+            logger.debug(f"SQLite cache unavailable at {db_path}, caching disabled: {e}")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a cache backend is connected"""
+        return self._redis is not None or self._db is not None
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a stable cache key from the given string parts"""
+        digest = hashlib.sha1("|".join(parts).encode()).hexdigest()  # nosec B324 - key derivation, not crypto
+        return f"nsaf:{digest}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Fetch and deserialize a cached value, or None on miss/error"""
+        try:
+            if self._redis is not None:
+                raw = self._redis.get(key)
+                if raw is not None:
+                    return pickle.loads(raw)  # nosec B301 - values are written only by this tool
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    if row[1] > time.time():
+                        return pickle.loads(row[0])  # nosec B301 - values are written only by this tool
+                    self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    self._db.commit()
+        except Exception as e:
+            logger.debug(f"Cache read failed for {key}: {e}")
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Serialize and store a value with the configured TTL"""
+        try:
+            if self._redis is not None:
+                self._redis.setex(key, self.ttl, pickle.dumps(value))
+            elif self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires) "
+                    "VALUES (?, ?, ?)",
+                    (key, pickle.dumps(value), time.time() + self.ttl),
+                )
+                self._db.commit()
+        except Exception as e:
+            logger.debug(f"Cache write failed for {key}: {e}")
@@ -4,9 +4,17 @@ Configuration management for NSAF
 
 import json
 import yaml
+try:
+    # PyYAML's C parser/emitter are 10x+ faster than the pure-Python ones
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Sentinel distinguishing "not cached" from cached None values
+_MISSING = object()
+
 class NSAFConfig:
     """NSAF Configuration Manager"""
     
@@ -14,6 +22,8 @@ class NSAFConfig:
         """Initialize configuration manager"""
         self.config_file = config_file or "nsaf_config.yaml"
         self.config = self._load_default_config()
+        # Resolved dot-path lookups; cleared whenever the config mutates
+        self._lookup_cache: Dict[str, Any] = {}
         self._load_config()
     
     def _load_default_config(self) -> Dict[str, Any]:
@@ -56,35 +66,49 @@ class NSAFConfig:
             try:
                 with open(config_path, 'r') as f:
                     if config_path.suffix.lower() == '.yaml' or config_path.suffix.lower() == '.yml':
-                        file_config = yaml.safe_load(f)
+                        file_config = yaml.load(f, Loader=_YamlLoader)
                     else:
                         file_config = json.load(f)
                 
                 # Merge with default config
                 self._merge_config(self.config, file_config)
+                self._lookup_cache.clear()
                 
             except Exception as e:
                 print(f"Error loading config file {config_path}: {e}")
     
     def _merge_config(self, default: Dict[str, Any], override: Dict[str, Any]) -> None:
-        """Recursively merge configuration dictionaries"""
-        for key, value in override.items():
-            if key in default and isinstance(default[key], dict) and isinstance(value, dict):
-                self._merge_config(default[key], value)
-            else:
-                default[key] = value
+        """Merge configuration dictionaries iteratively
+
+        An explicit stack of (default, override) pairs replaces Python
+        recursion, so arbitrarily deep configs merge without recursion
+        depth limits or per-level call overhead.
+        """
+        stack = [(default, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if key in dst and isinstance(dst[key], dict) and isinstance(value, dict):
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation"""
-        keys = key_path.split('.')
+        # Hot paths read the same keys repeatedly; resolved paths are
+        # served from the cache until the next set() or reload
+        cached = self._lookup_cache.get(key_path, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
         value = self.config
-        
-        for key in keys:
+        for key in key_path.split('.'):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
                 return default
-        
+
+        self._lookup_cache[key_path] = value
         return value
     
     def set(self, key_path: str, value: Any) -> None:
@@ -98,6 +122,7 @@ class NSAFConfig:
             config = config[key]
         
         config[keys[-1]] = value
+        self._lookup_cache.clear()
     
     def save(self, filename: Optional[str] = None) -> None:
         """Save configuration to file"""
@@ -105,7 +130,7 @@ class NSAFConfig:
         
         with open(save_path, 'w') as f:
             if Path(save_path).suffix.lower() in ['.yaml', '.yml']:
-                yaml.dump(self.config, f, default_flow_style=False, indent=2)
+                yaml.dump(self.config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
             else:
                 json.dump(self.config, f, indent=2)
     
@@ -143,7 +168,7 @@ class NSAFConfig:
         }
         
         with open(filename, 'w') as f:
-            yaml.dump(sample_config, f, default_flow_style=False, indent=2)
+            yaml.dump(sample_config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
         
         print(f"Sample configuration created: {filename}")
 
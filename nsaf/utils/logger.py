@@ -2,69 +2,118 @@
 Logging utility for NSAF
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 # Create logs directory if it doesn't exist
 log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
 
-def get_logger(name: str, level: int = logging.INFO, 
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# All loggers enqueue records here; a single background listener thread
+# does the actual console/file I/O so scan threads never block on write()
+_log_queue: queue.Queue = queue.Queue(-1)
+_listener: Optional[QueueListener] = None
+
+# One queue (and thus one open fd) per log file path, shared by every
+# logger that targets it; 50 MB rotation with 10 backups bounds disk use
+_FILE_QUEUES: Dict[str, queue.Queue] = {}
+_MAX_LOG_BYTES = 50_000_000
+_LOG_BACKUP_COUNT = 10
+
+def _file_queue(path: str) -> queue.Queue:
+    """Return the shared queue feeding the listener for this log file"""
+    file_queue = _FILE_QUEUES.get(path)
+    if file_queue is None:
+        handler = RotatingFileHandler(path, maxBytes=_MAX_LOG_BYTES,
+                                      backupCount=_LOG_BACKUP_COUNT)
+        handler.setLevel(logging.DEBUG)
+        handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+
+        file_queue = queue.Queue(-1)
+        listener = QueueListener(file_queue, handler,
+                                 respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        _FILE_QUEUES[path] = file_queue
+    return file_queue
+
+def _ensure_listener(level: int) -> None:
+    """Start the shared queue listener on first use"""
+    global _listener
+    if _listener is not None:
+        return
+
+    formatter = logging.Formatter(_LOG_FORMAT)
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(level)
+    console_handler.setFormatter(formatter)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    file_handler = RotatingFileHandler(f"logs/nsaf_{timestamp}.log",
+                                       maxBytes=_MAX_LOG_BYTES,
+                                       backupCount=_LOG_BACKUP_COUNT)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+
+    _listener = QueueListener(_log_queue, console_handler, file_handler,
+                              respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+@functools.lru_cache(maxsize=128)
+def get_logger(name: str, level: int = logging.INFO,
                log_file: Optional[str] = None) -> logging.Logger:
     """
     Get a configured logger instance
-    
+
+    Repeated calls with the same arguments return the cached instance
+    without re-running the handler setup below. Loggers emit through a
+    QueueHandler, so the calling thread only pays for a queue.put while
+    the listener thread performs the console and file writes.
+
     Args:
         name: Logger name (usually __name__)
         level: Logging level
         log_file: Optional log file path
-        
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
-    
+
     # Avoid adding handlers multiple times
     if logger.handlers:
         return logger
-        
+
     logger.setLevel(level)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
-    if log_file is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = f"logs/nsaf_{timestamp}.log"
-        
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    
+
+    _ensure_listener(level)
+    logger.addHandler(QueueHandler(_log_queue))
+
+    if log_file is not None:
+        # Dedicated log files share one rotating handler per path, so
+        # many loggers pointed at the same file cost a single fd
+        logger.addHandler(QueueHandler(_file_queue(log_file)))
+
     return logger
 
 def setup_logging(verbose: bool = False) -> None:
     """Setup global logging configuration"""
     level = logging.DEBUG if verbose else logging.INFO
-    
+
+    _ensure_listener(level)
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(f"logs/nsaf_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"),
-            logging.StreamHandler(sys.stdout)
-        ]
+        format=_LOG_FORMAT,
+        handlers=[QueueHandler(_log_queue)]
     )
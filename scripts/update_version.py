@@ -4,15 +4,27 @@ Version updater script for NSAF setup.py
 Safely updates the version string in setup.py
 """
 
+import mmap
 import re
 import sys
 from pathlib import Path
 
+# Compiled once; the capture group yields the old version from the same
+# pass that performs the substitution
+_VERSION_RE = re.compile(r'version\s*=\s*["\']([^"\']*)["\']')
+
+# Bytes twin for scanning a memory-mapped file without decoding it
+_VERSION_RE_B = re.compile(rb'version\s*=\s*["\']([^"\']*)["\']')
+
 
 def update_version(setup_file: str, new_version: str) -> bool:
     """
     Update the version in setup.py file.
     
+    Reads the file once: a single subn both finds the current version
+    and produces the updated content, so there is no separate search
+    pass or second read.
+    
     Args:
         setup_file: Path to setup.py file
         new_version: New version string
@@ -29,17 +41,13 @@ def update_version(setup_file: str, new_version: str) -> bool:
         # Read the current content
         content = setup_path.read_text(encoding='utf-8')
         
-        # Update version using regex
-        version_pattern = r'version\s*=\s*["\'][^"\']*["\']'
-        new_version_string = f'version="{new_version}"'
-        
-        # Check if version exists
-        if not re.search(version_pattern, content):
+        current = _VERSION_RE.search(content)
+        if current is None:
             print(f"Error: version field not found in {setup_file}")
             return False
+        print(f"Current version: {current.group(1)}")
         
-        # Replace version
-        updated_content = re.sub(version_pattern, new_version_string, content)
+        updated_content = _VERSION_RE.sub(f'version="{new_version}"', content)
         
         # Write back to file
         setup_path.write_text(updated_content, encoding='utf-8')
@@ -55,12 +63,13 @@ def update_version(setup_file: str, new_version: str) -> bool:
 def get_current_version(setup_file: str) -> str:
     """Get current version from setup.py"""
     try:
-        setup_path = Path(setup_file)
-        content = setup_path.read_text(encoding='utf-8')
-        
-        match = re.search(r'version\s*=\s*["\']([^"\']*)["\']', content)
-        if match:
-            return match.group(1)
+        # The version sits near the top of the file; scanning the mmap
+        # with a bytes regex skips decoding the whole file as UTF-8
+        with open(setup_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                match = _VERSION_RE_B.search(m)
+                if match:
+                    return match.group(1).decode('utf-8')
         return "unknown"
     except Exception:
         return "unknown"
@@ -80,9 +89,8 @@ def main():
     if not re.match(r'^\d+\.\d+\.\d+', new_version):
         print(f"Warning: Version '{new_version}' doesn't follow semantic versioning")
     
-    # Show current version
-    current_version = get_current_version(setup_file)
-    print(f"Current version: {current_version}")
+    # update_version reports the current version from its own read, so
+    # the file is touched exactly once here
     print(f"New version: {new_version}")
     
     # Update version
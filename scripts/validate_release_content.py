@@ -5,8 +5,13 @@ Release content validator - Shows what files will be included/excluded in releas
 
 import os
 import fnmatch
+import re
 from pathlib import Path
 
+def _compile_union(patterns):
+    """Compile a list of fnmatch patterns into one alternation regex"""
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
 class ReleaseValidator:
     def __init__(self, repo_path="."):
         self.repo_path = Path(repo_path).resolve()
@@ -65,20 +70,38 @@ class ReleaseValidator:
             "example_*"
         ]
 
+        # Union regexes collapse the dozens of per-file fnmatch calls
+        # into a single C-level match; the per-pattern loops below run
+        # only on hits, to recover which pattern fired for the report
+        self._gitattributes_re = _compile_union(self.gitattributes_excludes)
+        self._gitignore_re = _compile_union(self.gitignore_patterns)
+
+        # Directories whose entire subtree is excluded; pruned during
+        # the walk so their contents are never read from disk
+        self._excluded_dirs = frozenset([
+            '__pycache__', '.pytest_cache', '.vscode', '.idea', 'logs',
+            'reports', '.venv', 'venv', '.git', '.mypy_cache',
+            'node_modules', 'build', 'dist', '.eggs', 'htmlcov',
+            'cache', '.cache'
+        ])
+
     def should_exclude(self, file_path):
         """Check if a file should be excluded from releases"""
         rel_path = file_path.relative_to(self.repo_path)
         path_str = str(rel_path)
+        name = file_path.name
         
         # Check gitattributes excludes
-        for pattern in self.gitattributes_excludes:
-            if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(file_path.name, pattern):
-                return True, f"gitattributes export-ignore: {pattern}"
+        if self._gitattributes_re.match(path_str) or self._gitattributes_re.match(name):
+            for pattern in self.gitattributes_excludes:
+                if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(name, pattern):
+                    return True, f"gitattributes export-ignore: {pattern}"
         
         # Check gitignore patterns
-        for pattern in self.gitignore_patterns:
-            if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(file_path.name, pattern):
-                return True, f"gitignore pattern: {pattern}"
+        if self._gitignore_re.match(path_str) or self._gitignore_re.match(name):
+            for pattern in self.gitignore_patterns:
+                if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(name, pattern):
+                    return True, f"gitignore pattern: {pattern}"
                 
         # Check directory patterns
         for part in rel_path.parts:
@@ -92,12 +115,23 @@ class ReleaseValidator:
         included_files = []
         excluded_files = []
         
-        for file_path in self.repo_path.rglob("*"):
-            if file_path.is_file():
-                # Skip .git directory
-                if '.git' in file_path.parts:
-                    continue
-                    
+        # os.walk rides scandir, so entry types come from the dirent
+        # instead of a stat call per path; .git is pruned up front
+        # rather than filtered file-by-file
+        for dirpath, dirnames, filenames in os.walk(self.repo_path):
+            # Prune excluded subtrees in place: filtering their files
+            # after the fact would still pay the full dirent scan
+            kept = []
+            for name in dirnames:
+                if name in self._excluded_dirs or name.endswith('.egg-info'):
+                    dir_path = Path(dirpath) / name
+                    if name != '.git':
+                        excluded_files.append((dir_path, f"excluded directory: {name}"))
+                else:
+                    kept.append(name)
+            dirnames[:] = kept
+            for name in filenames:
+                file_path = Path(dirpath) / name
                 excluded, reason = self.should_exclude(file_path)
                 if excluded:
                     excluded_files.append((file_path, reason))
@@ -3,7 +3,7 @@
 Setup script for Network Security Assessment Framework (NSAF)
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
 # Read the contents of README file
@@ -51,7 +51,10 @@ setup(
         "Documentation": "https://yourusername.github.io/network-security-assessment-framework/",
         "Source": "https://github.com/yourusername/network-security-assessment-framework",
     },
-    packages=find_packages(),
+    # Static list instead of find_packages(): the package set changes
+    # rarely and skipping the source-tree walk shaves every build,
+    # install, and metadata query
+    packages=["nsaf", "nsaf.core", "nsaf.utils"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Information Technology",